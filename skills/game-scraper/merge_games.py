@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Merges several raw scrape files into one deduplicated games.json.
+Games are matched on (sport, local date, home, away) with team names compared
+word-wise, so the same game scraped from different sources (as "Chicago",
+"Bulls" or "Chicago Bulls", or under different game_ids) collapses to one entry.
+Conflicting values are resolved by source priority or freshness.
+Usage: python merge_games.py <raw1.json> [raw2.json ...] [--strategy priority|freshness] [--output PATH]
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+LOCAL_TZ = ZoneInfo("America/New_York")  # game_id dates use the US Eastern calendar day
+COMPARED_FIELDS = ["game_time", "spread", "moneyline", "total", "venue"]
+STRATEGIES = ["priority", "freshness"]
+
+
+def load_config():
+    config_path = Path(__file__).parent.parent.parent / "config.json"
+    if not config_path.exists():
+        print(f"Error: config.json not found at {config_path}")
+        sys.exit(1)
+    with open(config_path) as f:
+        return json.load(f)
+
+
+def save_json(path, data):
+    """Save data to JSON file with pretty formatting."""
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+def parse_timestamp(ts):
+    """Parse ISO 8601 timestamp to datetime, or None if invalid."""
+    try:
+        return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        return None
+
+
+def normalize_team(name, aliases=None):
+    """
+    Normalize a team name for matching across sources.
+    "St. John's Red Storm" and "Saint Johns Red Storm" both become "st johns red storm".
+    aliases maps normalized names to their canonical normalized name.
+    """
+    name = (name or "").lower().replace("&", " and ")
+    name = re.sub(r"[.'’]", "", name)
+    name = re.sub(r"[^a-z0-9]+", " ", name).strip()
+    name = re.sub(r"^saint\b", "st", name)
+    return (aliases or {}).get(name, name)
+
+
+def load_aliases(raw_aliases):
+    """Normalize both sides of the config team_aliases table."""
+    return {normalize_team(k): normalize_team(v) for k, v in (raw_aliases or {}).items()}
+
+
+def nickname(name):
+    """Last word of a normalized team name ("chicago bulls" -> "bulls")."""
+    return name.rsplit(" ", 1)[-1]
+
+
+def name_keys(name):
+    """
+    Index keys for a normalized name: its first and last word. Two names where
+    one is a leading or trailing run of the other's words always share one.
+    """
+    words = name.split()
+    return {("first", words[0]), ("last", words[-1])} if words else set()
+
+
+def same_team(a, b):
+    """
+    True if two normalized names can refer to the same team: equal, or one is
+    the other with words dropped from either end ("bulls" or "chicago" vs
+    "chicago bulls", "florida" vs "florida gators").
+    """
+    if a == b:
+        return True
+    short, full = sorted((a.split(), b.split()), key=len)
+    if not short:
+        return False
+    return full[:len(short)] == short or full[-len(short):] == short
+
+
+def game_identity(game, aliases=None):
+    """
+    Return (sport, local date, normalized home, normalized away), or None
+    if game_time cannot be parsed.
+    """
+    game_time = parse_timestamp(game.get("game_time"))
+    if game_time is None:
+        return None
+    if game_time.tzinfo is not None:
+        game_time = game_time.astimezone(LOCAL_TZ)
+    return (
+        (game.get("sport") or "").upper(),
+        game_time.strftime("%Y-%m-%d"),
+        normalize_team(game.get("home_team"), aliases),
+        normalize_team(game.get("away_team"), aliases)
+    )
+
+
+def canonical_key(identity):
+    """Hash of a game identity tuple."""
+    return hashlib.sha1("|".join(identity).encode()).hexdigest()
+
+
+def load_scrape(path):
+    """
+    Load a raw scrape file and tag each game with its source and fetch time.
+    Source comes from the game, then the file's "source" field, then the file name.
+    """
+    with open(path) as f:
+        data = json.load(f)
+    source = data.get("source") or Path(path).stem
+    fetched_at = data.get("fetched_at")
+    games = []
+    for game in data.get("games", []):
+        tagged = dict(game)
+        tagged.setdefault("source", source)
+        tagged.setdefault("fetched_at", fetched_at)
+        games.append(tagged)
+    return games, fetched_at
+
+
+def rank(game, strategy, priorities):
+    """Sort key where lower wins."""
+    source_rank = priorities.get((game.get("source") or "").lower(), len(priorities))
+    fetched = parse_timestamp(game.get("fetched_at"))
+    freshness = -fetched.timestamp() if fetched else float("inf")
+    if strategy == "freshness":
+        return (freshness, source_rank)
+    return (source_rank, freshness)
+
+
+def merge_games(games, strategy="priority", source_priority=None, aliases=None):
+    """
+    Merge games from all sources in a single hashed pass.
+
+    Each team name is indexed by (sport, date, first word) and (sport, date,
+    last word), so a new game is only compared with games that could share a
+    team. Games whose home and away names are equal are one game; games whose
+    names only match loosely (see same_team) are one game if they also have the
+    same tip time. Other near-misses are reported as suspected collisions rather
+    than merged: a loose match with a different tip time, the same nicknames
+    on different teams, or distinct games that share a team.
+
+    Returns (merged_games, collisions, suspected, unkeyed) where collisions
+    describes every merged group of more than one game, suspected lists
+    (game_id, game_id, reason) near-misses, and unkeyed lists games whose
+    game_time could not be parsed (passed through unmerged).
+    """
+    priorities = {s.lower(): i for i, s in enumerate(source_priority or [])}
+    index = {}
+    groups = []
+    suspected = {}
+    unkeyed = []
+
+    for game in games:
+        identity = game_identity(game, aliases)
+        if identity is None:
+            unkeyed.append(game)
+            continue
+        sport, date, home, away = identity
+        game_time = parse_timestamp(game.get("game_time"))
+
+        candidates = {}
+        for team in (home, away):
+            for key in name_keys(team):
+                for group in index.get((sport, date) + key, []):
+                    candidates[id(group)] = group
+
+        match = None
+        near_misses = []
+        for group in candidates.values():
+            _, _, group_home, group_away = group["identity"]
+            if home == group_home and away == group_away:
+                match = group
+                break
+            if same_team(home, group_home) and same_team(away, group_away):
+                if game_time == group["game_time"]:
+                    match = group
+                    break
+                near_misses.append((group, "names match loosely, tip times differ"))
+                continue
+            shared = [t for t in (home, away) for g in (group_home, group_away) if same_team(t, g)]
+            if shared:
+                # A team plays at most once per day, so a shared team means a likely duplicate
+                near_misses.append((group, f"both include '{shared[0]}'"))
+            elif nickname(home) == nickname(group_home) and nickname(away) == nickname(group_away):
+                near_misses.append((group, "same nicknames, different teams"))
+
+        if match:
+            match["games"].append(game)
+            continue
+        for group, reason in near_misses:
+            suspected.setdefault((group["games"][0].get("game_id"), game.get("game_id")), reason)
+        group = {"identity": identity, "game_time": game_time, "games": [game]}
+        groups.append(group)
+        for team in (home, away):
+            for key in name_keys(team):
+                index.setdefault((sport, date) + key, []).append(group)
+
+    merged_games = []
+    collisions = []
+    for group in groups:
+        candidates = sorted(group["games"], key=lambda g: rank(g, strategy, priorities))
+        winner = candidates[0]
+        merged = dict(winner)
+        # Fill fields the winner left empty from the other sources
+        for other in candidates[1:]:
+            for field, value in other.items():
+                if not merged.get(field) and value:
+                    merged[field] = value
+        merged_games.append(merged)
+
+        if len(candidates) == 1:
+            continue
+        conflicts = {}
+        for field in COMPARED_FIELDS:
+            values = {c.get(field) for c in candidates if c.get(field)}
+            if field == "game_time":
+                # Same kickoff written in different offsets is not a conflict
+                distinct = {parse_timestamp(v) for v in values}
+            else:
+                distinct = values
+            if len(distinct) > 1:
+                conflicts[field] = sorted(values)
+        collisions.append({
+            "key": canonical_key(group["identity"]),
+            "game_id": merged.get("game_id"),
+            "game_ids": sorted({c.get("game_id") for c in candidates if c.get("game_id")}),
+            "sources": [c.get("source") for c in group["games"]],
+            "chosen_source": winner.get("source"),
+            "conflicts": conflicts
+        })
+
+    merged_games.sort(key=lambda g: (g.get("game_time") or "", g.get("game_id") or ""))
+    merged_games.extend(unkeyed)
+    # source and fetched_at are merge bookkeeping, not part of the games.json format
+    for game in merged_games:
+        game.pop("source", None)
+        game.pop("fetched_at", None)
+    suspected = [(first, second, reason) for (first, second), reason in suspected.items()]
+    return merged_games, collisions, suspected, unkeyed
+
+
+def main():
+    config = load_config()
+    base_path = Path(__file__).parent.parent.parent
+
+    parser = argparse.ArgumentParser(description="Merge raw scrape files into games.json")
+    parser.add_argument("files", nargs="+", help="Raw scrape files in games.json format")
+    parser.add_argument("--strategy", choices=STRATEGIES, default="priority",
+                        help="Resolve conflicts by source priority (config scrape_sources) or latest fetched_at")
+    parser.add_argument("--output", help="Output path (default: games path from config.json)")
+    args = parser.parse_args()
+
+    all_games = []
+    fetched_times = []
+    for path in args.files:
+        try:
+            games, fetched_at = load_scrape(path)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Error: could not read {path}: {e}")
+            sys.exit(1)
+        print(f"Loaded {len(games)} games from {path}")
+        all_games.extend(games)
+        if parse_timestamp(fetched_at):
+            fetched_times.append(fetched_at)
+
+    merged, collisions, suspected, unkeyed = merge_games(
+        all_games, args.strategy, config.get("scrape_sources", []), load_aliases(config.get("team_aliases"))
+    )
+
+    output_path = Path(args.output) if args.output else base_path / config["paths"]["games"]
+    fetched_at = max(fetched_times, key=lambda ts: parse_timestamp(ts)) if fetched_times else None
+    save_json(output_path, {"fetched_at": fetched_at, "games": merged})
+
+    print(f"\nMerge complete ({args.strategy}):")
+    print(f"  Input games: {len(all_games)}")
+    print(f"  Output games: {len(merged)}")
+    print(f"  Collisions: {len(collisions)}")
+    print(f"  Suspected collisions (not merged): {len(suspected)}")
+    if unkeyed:
+        print(f"  Unparseable game_time (not merged): {len(unkeyed)}")
+
+    for c in collisions:
+        ids = ", ".join(c["game_ids"])
+        print(f"\n  {c['game_id']} <- {', '.join(str(s) for s in c['sources'])} (kept {c['chosen_source']})")
+        if len(c["game_ids"]) > 1:
+            print(f"    game_ids: {ids}")
+        for field, values in c["conflicts"].items():
+            print(f"    {field}: {' | '.join(values)}")
+
+    if suspected:
+        print("\nSuspected collisions (add a team_aliases entry in config.json if these are the same game):")
+        for first, second, reason in suspected:
+            print(f"  {first} / {second}: {reason}")
+
+    print(f"\nWrote {output_path}")
+
+
+if __name__ == "__main__":
+    main()
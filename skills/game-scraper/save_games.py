@@ -5,6 +5,8 @@ Run after Claude writes game data to verify correctness.
 """
 
 import json
+import re
+import shutil
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -76,11 +78,18 @@ def validate_games_file(games_path):
 
     games = data["games"]
     stats = {"total": len(games), "NBA": 0, "NCAAB": 0}
+    seen_ids = {}
 
     for i, game in enumerate(games):
         game_errors = validate_game(game, i)
         errors.extend(game_errors)
 
+        game_id = game.get("game_id")
+        if game_id in seen_ids:
+            errors.append(f"Game {i}: duplicate game_id '{game_id}' (first seen at game {seen_ids[game_id]})")
+        elif game_id:
+            seen_ids[game_id] = i
+
         if "sport" in game:
             if game["sport"] == "NBA":
                 stats["NBA"] += 1
@@ -89,6 +98,19 @@ def validate_games_file(games_path):
 
     return len(errors) == 0, errors, stats
 
+def archive_games(games_path, archive_dir):
+    """
+    Copy a validated games.json into the archive, named by its fetched_at.
+    The archive lets the trend index be rebuilt after games.json is overwritten.
+    """
+    with open(games_path) as f:
+        data = json.load(f)
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    stamp = re.sub(r"[^0-9A-Za-z]+", "-", data["fetched_at"]).strip("-")
+    archive_path = archive_dir / f"games-{stamp}.json"
+    shutil.copyfile(games_path, archive_path)
+    return archive_path
+
 def main():
     config = load_config()
     games_path = Path(__file__).parent.parent.parent / config["paths"]["games"]
@@ -103,6 +125,8 @@ def main():
         sys.exit(1)
 
     print("\nValidation PASSED")
+    archive_path = archive_games(games_path, Path(__file__).parent.parent.parent / config["paths"]["games_archive"])
+    print(f"  Archived to: {archive_path}")
     print(f"  Total games: {stats['total']}")
     print(f"  NBA: {stats['NBA']}")
     print(f"  NCAAB: {stats['NCAAB']}")
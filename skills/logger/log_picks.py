@@ -1,14 +1,18 @@
 #!/usr/bin/env python3
 """
 Moves picks from picks.json to history.json with PENDING status.
-Skips NO PICK entries and duplicates.
+Parses each pick into bet_type / side / line so grading is a numeric comparison.
+Skips NO PICK entries and duplicates; rejects picks that cannot be parsed.
 """
 
 import json
+import re
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+NUMBER = r'\d+(?:\.\d+)?'  # "8", "228.5"; rejects "2.2.5" and "."
+
 def load_config():
     config_path = Path(__file__).parent.parent.parent / "config.json"
     if not config_path.exists():
@@ -29,41 +33,109 @@ def save_json(path, data):
     with open(path, "w") as f:
         json.dump(data, f, indent=2)
 
-def main():
-    config = load_config()
-    base_path = Path(__file__).parent.parent.parent
-
-    picks_path = base_path / config["paths"]["picks"]
-    games_path = base_path / config["paths"]["games"]
-    history_path = base_path / config["paths"]["history"]
-
-    # Load data
-    picks_data = load_json(picks_path, {"picks": []})
-    games_data = load_json(games_path, {"games": []})
-    history = load_json(history_path, [])
-
-    # Build game_id -> game_time lookup
-    game_times = {g["game_id"]: g["game_time"] for g in games_data.get("games", [])}
+def parse_pick(pick_str):
+    """
+    Parse pick string into (bet_type, team, line).
+
+    - "Over 228.5" / "Under 150" -> ('total', 'over', 228.5) / ('total', 'under', 150.0)
+    - "Knicks ML"                -> ('moneyline', 'Knicks', None)
+    - "Knicks -2.5"              -> ('spread', 'Knicks', -2.5)
+
+    Returns None if the format is unrecognized.
+    This is the one pick grammar; update_result.py, odds_math.py and
+    generate_report.py import it.
+    """
+    pick_str = (pick_str or "").strip()
+
+    total_match = re.match(rf'^(Over|Under)\s+({NUMBER})$', pick_str, re.IGNORECASE)
+    if total_match:
+        return 'total', total_match.group(1).lower(), float(total_match.group(2))
+
+    ml_match = re.match(r'^(.+?)\s+ML$', pick_str, re.IGNORECASE)
+    if ml_match:
+        return 'moneyline', ml_match.group(1).strip(), None
+
+    spread_match = re.match(rf'^(.+?)\s+([+-]{NUMBER})$', pick_str)
+    if spread_match:
+        return 'spread', spread_match.group(1).strip(), float(spread_match.group(2))
+
+    return None
+
+def resolve_side(team, game_info, game_str):
+    """
+    Work out whether team is the home or away side.
+    Uses full names from games.json, falling back to the "Away vs Home" game string.
+    Returns 'home', 'away', or None if ambiguous or not found.
+    """
+    team = team.lower()
+    candidates = []
+    if game_info:
+        candidates.append((game_info.get("home_team", ""), game_info.get("away_team", "")))
+    parts = (game_str or "").split(" vs ")
+    if len(parts) == 2:
+        candidates.append((parts[1].strip(), parts[0].strip()))
+
+    for home, away in candidates:
+        in_home = team in home.lower()
+        in_away = team in away.lower()
+        if in_home and not in_away:
+            return 'home'
+        if in_away and not in_home:
+            return 'away'
+    return None
+
+def structure_pick(pick, game_info):
+    """
+    Build the structured bet fields for a pick.
+    Returns (fields, error) where fields has bet_type, side and line.
+    """
+    parsed = parse_pick(pick.get("pick"))
+    if not parsed:
+        return None, f"unrecognized pick format '{pick.get('pick')}'"
+
+    bet_type, team, line = parsed
+    if bet_type == 'total':
+        return {"bet_type": bet_type, "side": team, "line": line}, None
+
+    side = resolve_side(team, game_info, pick.get("game"))
+    if not side:
+        return None, f"could not tell if '{team}' is home or away in '{pick.get('game')}'"
+    return {"bet_type": bet_type, "side": side, "line": line}, None
+
+def log_picks(picks_data, games_data, history):
+    """
+    Append actual picks to history with PENDING status (modifies history in place).
+    Returns dict of counts (added, skipped_no_pick, skipped_duplicate, rejected)
+    plus 'errors', a list of messages for rejected picks.
+    """
+    # Build game_id -> game lookup
+    games_by_id = {g["game_id"]: g for g in games_data.get("games", [])}
 
     # Track existing game_ids in history
     existing_ids = {h["game_id"] for h in history}
 
     # Process picks
-    added = 0
-    skipped_no_pick = 0
-    skipped_duplicate = 0
+    counts = {"added": 0, "skipped_no_pick": 0, "skipped_duplicate": 0, "rejected": 0, "errors": []}
 
     for pick in picks_data.get("picks", []):
         game_id = pick.get("game_id")
 
         # Skip NO PICK entries
         if pick.get("pick") == "NO PICK":
-            skipped_no_pick += 1
+            counts["skipped_no_pick"] += 1
             continue
 
         # Skip duplicates
         if game_id in existing_ids:
-            skipped_duplicate += 1
+            counts["skipped_duplicate"] += 1
+            continue
+
+        # Parse once here so grading never has to
+        game_info = games_by_id.get(game_id)
+        fields, error = structure_pick(pick, game_info)
+        if error:
+            counts["rejected"] += 1
+            counts["errors"].append(f"{game_id}: {error}")
             continue
 
         # Create history entry
@@ -72,27 +144,48 @@ def main():
             "sport": pick.get("sport"),
             "game": pick.get("game"),
             "pick": pick.get("pick"),
+            "bet_type": fields["bet_type"],
+            "side": fields["side"],
+            "line": fields["line"],
             "odds": pick.get("odds"),
             "reasoning": pick.get("reasoning"),
             "confidence": pick.get("confidence"),
             "pick_time": pick.get("created_at"),
-            "game_time": game_times.get(game_id),
+            "game_time": game_info.get("game_time") if game_info else None,
             "result": "PENDING",
             "final_score": None
         }
 
         history.append(history_entry)
         existing_ids.add(game_id)
-        added += 1
+        counts["added"] += 1
+
+    return counts
+
+def main():
+    config = load_config()
+    base_path = Path(__file__).parent.parent.parent
+
+    picks_path = base_path / config["paths"]["picks"]
+    games_path = base_path / config["paths"]["games"]
+    history_path = base_path / config["paths"]["history"]
+
+    # Load data
+    picks_data = load_json(picks_path, {"picks": []})
+    games_data = load_json(games_path, {"games": []})
+    history = load_json(history_path, [])
+
+    counts = log_picks(picks_data, games_data, history)
 
     # Save updated history
     save_json(history_path, history)
 
     # Report results
     print(f"Logger complete:")
-    print(f"  Added to history: {added}")
-    print(f"  Skipped (NO PICK): {skipped_no_pick}")
-    print(f"  Skipped (duplicate): {skipped_duplicate}")
+    print(f"  Added to history: {counts['added']}")
+    print(f"  Skipped (NO PICK): {counts['skipped_no_pick']}")
+    print(f"  Skipped (duplicate): {counts['skipped_duplicate']}")
+    print(f"  Rejected (unparseable): {counts['rejected']}")
     print(f"  Total in history: {len(history)}")
 
     # List pending picks
@@ -102,5 +195,12 @@ def main():
         for p in pending:
             print(f"  - {p['game']}: {p['pick']} ({p['confidence']})")
 
+    # Rejected picks were not logged; fix picks.json and re-run
+    if counts["errors"]:
+        print(f"\nRejected picks ({counts['rejected']}):")
+        for error in counts["errors"]:
+            print(f"  - {error}")
+        sys.exit(1)
+
 if __name__ == "__main__":
     main()
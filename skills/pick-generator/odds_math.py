@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Odds math for picks: American <-> decimal <-> implied probability,
+no-vig fair prices, expected value and break-even win rate.
+Every function that takes a list works on a whole slate or all of history at once.
+Usage: python odds_math.py [--history]
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+
+# Pick strings are parsed with the logger's grammar
+sys.path.insert(0, str(Path(__file__).parent.parent / "logger"))
+from log_picks import resolve_side, structure_pick  # noqa: E402
+
+
+def load_config():
+    config_path = Path(__file__).parent.parent.parent / "config.json"
+    if not config_path.exists():
+        print(f"Error: config.json not found at {config_path}")
+        sys.exit(1)
+    with open(config_path) as f:
+        return json.load(f)
+
+
+def load_json(path, default=None):
+    """Load JSON file or return default if not exists."""
+    if not path.exists():
+        return default
+    with open(path) as f:
+        return json.load(f)
+
+
+# --- Scalar conversions ---
+
+def valid_odds(odds):
+    """True if odds is a number usable as American odds (<= -100 or >= +100)."""
+    return isinstance(odds, (int, float)) and not -100 < odds < 100
+
+
+def american_to_decimal(odds):
+    """Convert American odds (-110, +150) to decimal odds (1.909, 2.5)."""
+    if odds >= 100:
+        return 1 + odds / 100
+    if odds <= -100:
+        return 1 + 100 / -odds
+    raise ValueError(f"Invalid American odds: {odds}")
+
+
+def decimal_to_american(decimal):
+    """Convert decimal odds to American odds (rounded to nearest integer)."""
+    if decimal <= 1:
+        raise ValueError(f"Invalid decimal odds: {decimal}")
+    if decimal >= 2:
+        return round((decimal - 1) * 100)
+    return round(-100 / (decimal - 1))
+
+
+def american_to_implied(odds):
+    """Implied win probability of American odds (includes the vig)."""
+    return 1 / american_to_decimal(odds)
+
+
+def implied_to_american(prob):
+    """Fair American odds for a win probability."""
+    if not 0 < prob < 1:
+        raise ValueError(f"Probability must be between 0 and 1: {prob}")
+    return decimal_to_american(1 / prob)
+
+
+def break_even(odds):
+    """Win rate needed to break even at these odds (same as implied probability)."""
+    return american_to_implied(odds)
+
+
+def expected_value(odds, win_prob):
+    """Expected profit per 1 unit staked at these odds and win probability."""
+    return win_prob * (american_to_decimal(odds) - 1) - (1 - win_prob)
+
+
+def no_vig(odds_a, odds_b):
+    """
+    Remove the vig from a two-sided market.
+
+    Returns (prob_a, prob_b, overround) where the probabilities sum to 1.
+    """
+    implied_a = american_to_implied(odds_a)
+    implied_b = american_to_implied(odds_b)
+    total = implied_a + implied_b
+    return implied_a / total, implied_b / total, total - 1
+
+
+# --- Batch versions ---
+
+def american_to_decimal_batch(odds_list):
+    return [american_to_decimal(o) for o in odds_list]
+
+
+def american_to_implied_batch(odds_list):
+    return [1 / d for d in american_to_decimal_batch(odds_list)]
+
+
+def break_even_batch(odds_list):
+    return american_to_implied_batch(odds_list)
+
+
+def expected_value_batch(odds_list, probs):
+    """Expected value per unit for parallel lists of odds and win probabilities."""
+    if len(odds_list) != len(probs):
+        raise ValueError("odds and probabilities must have the same length")
+    decimals = american_to_decimal_batch(odds_list)
+    return [p * (d - 1) - (1 - p) for d, p in zip(decimals, probs)]
+
+
+def no_vig_batch(markets):
+    """No-vig probabilities for a list of (odds_a, odds_b) pairs."""
+    return [no_vig(a, b) for a, b in markets]
+
+
+# --- Parsing games.json / picks.json strings ---
+
+def parse_moneyline(moneyline_str):
+    """
+    Parse a two-sided moneyline string.
+    Format: "Knicks -140 / Spurs +120"
+
+    Returns list of (team, odds) pairs, or None if the format is unrecognized
+    or either side's odds are not valid American odds.
+    """
+    if not moneyline_str:
+        return None
+    sides = []
+    for part in moneyline_str.split(" / "):
+        match = re.match(r'^(.+?)\s+([+-]\d+)$', part.strip())
+        if not match:
+            return None
+        sides.append((match.group(1).strip(), int(match.group(2))))
+    if len(sides) != 2 or not all(valid_odds(odds) for _, odds in sides):
+        return None
+    return sides
+
+
+def moneyline_fair_probs(game):
+    """
+    No-vig probabilities of a game's moneyline keyed by 'home' / 'away'.
+    Returns None if the moneyline is missing or its teams can't be placed.
+    """
+    sides = parse_moneyline(game.get("moneyline"))
+    if not sides:
+        return None
+    (team_a, odds_a), (team_b, odds_b) = sides
+    prob_a, prob_b, _ = no_vig(odds_a, odds_b)
+    side_a = resolve_side(team_a, game, None)
+    side_b = resolve_side(team_b, game, None)
+    if not side_a or not side_b or side_a == side_b:
+        return None
+    return {side_a: prob_a, side_b: prob_b}
+
+
+def fair_probs(picks, games_by_id):
+    """
+    No-vig market probability for each pick.
+
+    Picks are placed with their stored bet_type / side (history entries) or
+    parsed with the logger's grammar (picks.json). Moneyline picks use the
+    no-vig probability of their side from games.json. Spread and total picks
+    are treated as a symmetric market at the pick's own price, so 0.5.
+
+    Returns a list parallel to picks; None where no estimate is possible.
+    """
+    probs = []
+    for pick in picks:
+        game = games_by_id.get(pick.get("game_id"), {})
+        bet_type, side = pick.get("bet_type"), pick.get("side")
+        if not bet_type:
+            fields, _ = structure_pick(pick, game)
+            bet_type, side = (fields["bet_type"], fields["side"]) if fields else (None, None)
+
+        if bet_type in ("spread", "total"):
+            probs.append(0.5)
+        elif bet_type == "moneyline":
+            market = moneyline_fair_probs(game)
+            probs.append(market.get(side) if market else None)
+        else:
+            probs.append(None)
+    return probs
+
+
+def estimated_probs(picks, confidence_probs=None):
+    """
+    The picker's estimated win probability for each pick: the pick's own
+    win_prob, else the config confidence_win_probs entry for its confidence.
+
+    Returns a list parallel to picks; None where neither is usable.
+    """
+    probs = []
+    for pick in picks:
+        prob = pick.get("win_prob")
+        if prob is None:
+            prob = (confidence_probs or {}).get(pick.get("confidence"))
+        probs.append(prob if isinstance(prob, (int, float)) and 0 < prob < 1 else None)
+    return probs
+
+
+def summarize_picks(picks, games_by_id, confidence_probs=None):
+    """
+    Compute odds metrics for a list of picks in one batch.
+
+    Returns list of dicts with pick, odds, decimal, break_even, fair_prob,
+    win_prob and ev. EV uses the estimated win_prob, not the market price.
+    NO PICK entries and entries without valid American odds are skipped.
+    """
+    rows = [p for p in picks if p.get("pick") != "NO PICK" and valid_odds(p.get("odds"))]
+    odds_list = [p["odds"] for p in rows]
+    decimals = american_to_decimal_batch(odds_list)
+    breakevens = [1 / d for d in decimals]
+    fair = fair_probs(rows, games_by_id)
+    estimated = estimated_probs(rows, confidence_probs)
+
+    summary = []
+    for pick, decimal, be, fair_prob, prob in zip(rows, decimals, breakevens, fair, estimated):
+        summary.append({
+            "game_id": pick.get("game_id"),
+            "pick": pick.get("pick"),
+            "odds": pick["odds"],
+            "decimal": decimal,
+            "break_even": be,
+            "fair_prob": fair_prob,
+            "win_prob": prob,
+            "ev": None if prob is None else prob * (decimal - 1) - (1 - prob)
+        })
+    return summary
+
+
+def units_won(result, odds):
+    """Profit at 1 unit staked on a WIN/LOSS/PUSH result, or None if odds are invalid."""
+    if not valid_odds(odds):
+        return None
+    if result == "WIN":
+        return american_to_decimal(odds) - 1
+    if result == "LOSS":
+        return -1.0
+    return 0.0
+
+
+def realized_units(history):
+    """
+    Units won or lost on graded history entries at 1 unit per pick.
+
+    Returns (units, graded_count, invalid_count). PENDING and CANCELLED entries
+    are ignored; graded entries with missing or invalid odds are counted as invalid.
+    """
+    units = 0.0
+    graded = 0
+    invalid = 0
+    for entry in history:
+        result = entry.get("result")
+        odds = entry.get("odds")
+        if result not in ("WIN", "LOSS", "PUSH"):
+            continue
+        won = units_won(result, odds)
+        if won is None:
+            invalid += 1
+            continue
+        graded += 1
+        units += won
+    return units, graded, invalid
+
+
+def format_pct(value):
+    return "  n/a" if value is None else f"{value * 100:5.1f}%"
+
+
+def main():
+    config = load_config()
+    base_path = Path(__file__).parent.parent.parent
+    picks_path = base_path / config["paths"]["picks"]
+    games_path = base_path / config["paths"]["games"]
+    history_path = base_path / config["paths"]["history"]
+
+    games_data = load_json(games_path, {"games": []})
+    games_by_id = {g["game_id"]: g for g in games_data.get("games", [])}
+
+    if "--history" in sys.argv[1:]:
+        history = load_json(history_path, [])
+        units, graded, invalid = realized_units(history)
+        odds_list = [h["odds"] for h in history if valid_odds(h.get("odds"))]
+        print(f"History: {len(history)} picks, {graded} graded")
+        if invalid:
+            print(f"  Skipped (graded, invalid odds): {invalid}")
+        if odds_list:
+            avg_be = sum(break_even_batch(odds_list)) / len(odds_list)
+            print(f"  Average break-even win rate: {format_pct(avg_be)}")
+        wins = sum(1 for h in history if h.get("result") == "WIN")
+        losses = sum(1 for h in history if h.get("result") == "LOSS")
+        if wins + losses:
+            print(f"  Actual win rate: {format_pct(wins / (wins + losses))}")
+        print(f"  Units (1u flat): {units:+.2f}")
+        return
+
+    picks_data = load_json(picks_path, {"picks": []})
+    summary = summarize_picks(picks_data.get("picks", []), games_by_id, config.get("confidence_win_probs"))
+
+    if not summary:
+        print("No picks with odds to summarize")
+        return
+
+    print(f"{'Pick':<28} {'Odds':>6} {'Dec':>6} {'B/E':>6} {'Fair':>6} {'Est':>6} {'EV':>7}")
+    for row in summary:
+        odds = f"{row['odds']:+d}" if isinstance(row["odds"], int) else str(row["odds"])
+        ev = "    n/a" if row["ev"] is None else f"{row['ev']:+7.3f}"
+        print(f"{row['pick']:<28} {odds:>6} {row['decimal']:6.3f} {format_pct(row['break_even'])} "
+              f"{format_pct(row['fair_prob'])} {format_pct(row['win_prob'])} {ev}")
+
+    evs = [r["ev"] for r in summary if r["ev"] is not None]
+    print(f"\nPicks: {len(summary)}")
+    if evs:
+        print(f"  Average EV at estimated win rate: {sum(evs) / len(evs):+.3f} units")
+
+    markets = [parse_moneyline(g.get("moneyline")) for g in games_by_id.values()]
+    markets = [m for m in markets if m]
+    if markets:
+        overrounds = [vig for _, _, vig in no_vig_batch([(a[1], b[1]) for a, b in markets])]
+        print(f"  Average moneyline vig on slate: {format_pct(sum(overrounds) / len(overrounds))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ Verifies game_ids match games in games.json.
 
 import json
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
 
 REQUIRED_FIELDS = ["game_id", "sport", "game", "pick", "reasoning", "created_at"]
@@ -21,16 +22,34 @@ def load_config():
     with open(config_path) as f:
         return json.load(f)
 
+def parse_timestamp(ts):
+    """Parse ISO 8601 timestamp to datetime, or None if invalid."""
+    try:
+        return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        return None
+
+def game_started(game_time, now=None):
+    """True if an ISO 8601 game_time is at or before now (defaults to current UTC time)."""
+    if now is None:
+        now = datetime.now(timezone.utc)
+    start = parse_timestamp(game_time)
+    return start is not None and start <= now
+
 def load_games(games_path):
-    """Load games.json and return set of game_ids."""
+    """Load games.json and return dict of game_id -> game_time."""
     if not games_path.exists():
-        return set()
+        return {}
     with open(games_path) as f:
         data = json.load(f)
-    return {g["game_id"] for g in data.get("games", [])}
-
-def validate_pick(pick, index, valid_game_ids):
-    """Validate a single pick entry. Returns list of errors."""
+    return {g["game_id"]: g.get("game_time") for g in data.get("games", [])}
+
+def validate_pick(pick, index, valid_game_ids, now=None):
+    """
+    Validate a single pick entry. Returns list of errors.
+    valid_game_ids maps game_id -> game_time. Actual picks must be made before
+    their game starts, checked at now if given, otherwise at the pick's created_at.
+    """
     errors = []
 
     for field in REQUIRED_FIELDS:
@@ -55,10 +74,20 @@ def validate_pick(pick, index, valid_game_ids):
 
         if "odds" in pick and not isinstance(pick["odds"], (int, float)):
             errors.append(f"Pick {index}: odds must be a number")
+        elif "odds" in pick and -100 < pick["odds"] < 100:
+            errors.append(f"Pick {index}: invalid American odds {pick['odds']} (must be <= -100 or >= +100)")
+
+        if "win_prob" in pick and not (isinstance(pick["win_prob"], (int, float)) and 0 < pick["win_prob"] < 1):
+            errors.append(f"Pick {index}: win_prob must be a number between 0 and 1")
+
+        made_at = now or parse_timestamp(pick.get("created_at"))
+        game_time = valid_game_ids.get(pick.get("game_id"))
+        if made_at and game_time and game_started(game_time, made_at):
+            errors.append(f"Pick {index}: game already started at {game_time}")
 
     return errors
 
-def validate_picks_file(picks_path, games_path):
+def validate_picks_file(picks_path, games_path, now=None):
     """Validate the picks.json file. Returns (is_valid, errors, stats)."""
     errors = []
 
@@ -97,7 +126,7 @@ def validate_picks_file(picks_path, games_path):
     }
 
     for i, pick in enumerate(picks):
-        pick_errors = validate_pick(pick, i, valid_game_ids)
+        pick_errors = validate_pick(pick, i, valid_game_ids, now)
         errors.extend(pick_errors)
 
         stats["total"] += 1
@@ -122,8 +151,17 @@ def main():
     picks_path = base_path / config["paths"]["picks"]
     games_path = base_path / config["paths"]["games"]
 
+    # Optional --now <ISO timestamp> checks game start against this time
+    # instead of each pick's created_at
+    now = None
+    if len(sys.argv) == 3 and sys.argv[1] == "--now":
+        now = parse_timestamp(sys.argv[2])
+        if not now:
+            print(f"Error: invalid --now timestamp: {sys.argv[2]}")
+            sys.exit(1)
+
     print(f"Validating {picks_path}...")
-    is_valid, errors, stats = validate_picks_file(picks_path, games_path)
+    is_valid, errors, stats = validate_picks_file(picks_path, games_path, now)
 
     if not is_valid:
         print("\nValidation FAILED:")
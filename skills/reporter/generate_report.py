@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Generates Markdown and HTML performance reports from history.json.
+Skips regeneration when history.json and the relevant config sections are
+unchanged, and re-renders only the sections whose inputs changed.
+Usage: python generate_report.py [--force]
+"""
+
+import hashlib
+import html
+import json
+import sys
+from pathlib import Path
+
+# Pick strings are parsed with the logger's grammar; payouts use the pick-generator's odds math
+sys.path.insert(0, str(Path(__file__).parent.parent / "logger"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "pick-generator"))
+from log_picks import parse_pick  # noqa: E402
+from odds_math import units_won  # noqa: E402
+
+REPORT_NAME = "performance"
+STATE_FILE = ".report_state.json"
+CONFIG_SECTIONS = ["sports", "confidence_levels"]  # Config keys that affect report output
+RECENT_COUNT = 10
+GRADED_RESULTS = ["WIN", "LOSS", "PUSH"]
+
+
+def load_config():
+    config_path = Path(__file__).parent.parent.parent / "config.json"
+    if not config_path.exists():
+        print(f"Error: config.json not found at {config_path}")
+        sys.exit(1)
+    with open(config_path) as f:
+        return json.load(f)
+
+
+def load_json(path, default=None):
+    """Load JSON file or return default if not exists."""
+    if not path.exists():
+        return default
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_json(path, data):
+    """Save data to JSON file with pretty formatting."""
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+def digest(value):
+    """Stable sha256 of a JSON-serializable value."""
+    return hashlib.sha256(json.dumps(value, sort_keys=True).encode()).hexdigest()
+
+
+def bet_type(pick_str):
+    """Classify a pick string as 'spread', 'total', 'moneyline', or 'other'."""
+    parsed = parse_pick(pick_str)
+    return parsed[0] if parsed else "other"
+
+
+# --- Section inputs ---
+# section_inputs() returns the minimal slice of data each section renders from;
+# its digest decides whether the section is re-rendered.
+
+def record_rows(history, key_fn, order=None):
+    """Group graded picks by key into [key, wins, losses, pushes, units] rows."""
+    groups = {}
+    for entry in history:
+        result = entry.get("result")
+        if result not in GRADED_RESULTS:
+            continue
+        key = key_fn(entry)
+        row = groups.setdefault(key, [key, 0, 0, 0, 0.0])
+        row[1 + GRADED_RESULTS.index(result)] += 1
+        # Entries with invalid odds count toward the record but not units, as in odds_math.py --history
+        row[4] = round(row[4] + (units_won(result, entry.get("odds")) or 0.0), 4)
+    keys = [k for k in (order or []) if k in groups] + sorted(k for k in groups if k not in (order or []))
+    return [groups[k] for k in keys]
+
+
+def section_inputs(history, config):
+    sports = [s for s, cfg in config.get("sports", {}).items() if cfg.get("enabled")]
+    confidence = config.get("confidence_levels", [])
+    pending = [
+        [h.get("game_time"), h.get("game_id"), h.get("game"), h.get("pick"), h.get("confidence")]
+        for h in history if h.get("result") == "PENDING"
+    ]
+    graded = [h for h in history if h.get("result") in GRADED_RESULTS + ["CANCELLED"]]
+    graded.sort(key=lambda h: h.get("game_time") or "")
+    recent = [
+        [h.get("game_time"), h.get("game"), h.get("pick"), h.get("odds"), h.get("result"), h.get("final_score")]
+        for h in graded[-RECENT_COUNT:][::-1]
+    ]
+    return {
+        "overall": record_rows(history, lambda h: "All picks"),
+        "by_sport": record_rows(history, lambda h: h.get("sport") or "Unknown", sports),
+        "by_confidence": record_rows(history, lambda h: h.get("confidence") or "none", confidence),
+        "by_bet_type": record_rows(history, lambda h: h.get("bet_type") or bet_type(h.get("pick")), ["spread", "total", "moneyline"]),
+        "pending": sorted(pending, key=lambda p: p[0] or ""),
+        "recent": recent
+    }
+
+
+# --- Rendering ---
+
+SECTION_TITLES = {
+    "overall": "Overall Record",
+    "by_sport": "By Sport",
+    "by_confidence": "By Confidence",
+    "by_bet_type": "By Bet Type",
+    "pending": "Pending Picks",
+    "recent": "Recent Results"
+}
+SECTION_ORDER = ["overall", "by_sport", "by_confidence", "by_bet_type", "pending", "recent"]
+
+
+def table_for(name, rows):
+    """Return (headers, string rows) for a section."""
+    if name == "pending":
+        return ["Game Time", "Game", "Pick", "Confidence"], [[r[0], r[2], r[3], r[4]] for r in rows]
+    if name == "recent":
+        table = []
+        for game_time, game, pick, odds, result, final_score in rows:
+            odds_str = f"{odds:+d}" if isinstance(odds, int) else ("" if odds is None else str(odds))
+            table.append([game_time, game, pick, odds_str, result, final_score])
+        return ["Game Time", "Game", "Pick", "Odds", "Result", "Final Score"], table
+    table = []
+    for key, wins, losses, pushes, units in rows:
+        decided = wins + losses
+        pct = f"{wins / decided * 100:.1f}%" if decided else "-"
+        table.append([key, f"{wins}-{losses}-{pushes}", pct, f"{units:+.2f}"])
+    return ["", "W-L-P", "Win %", "Units"], table
+
+
+def render_markdown(name, rows):
+    headers, table = table_for(name, rows)
+    lines = [f"## {SECTION_TITLES[name]}", ""]
+    if not table:
+        lines.append("_None_")
+        return "\n".join(lines)
+    lines.append("| " + " | ".join(headers) + " |")
+    lines.append("|" + "|".join("---" for _ in headers) + "|")
+    for row in table:
+        lines.append("| " + " | ".join("" if c is None else str(c) for c in row) + " |")
+    return "\n".join(lines)
+
+
+def render_html(name, rows):
+    headers, table = table_for(name, rows)
+    parts = [f"<h2>{html.escape(SECTION_TITLES[name])}</h2>"]
+    if not table:
+        parts.append("<p><em>None</em></p>")
+        return "\n".join(parts)
+    parts.append("<table>")
+    parts.append("<tr>" + "".join(f"<th>{html.escape(h)}</th>" for h in headers) + "</tr>")
+    for row in table:
+        cells = "".join(f"<td>{html.escape('' if c is None else str(c))}</td>" for c in row)
+        parts.append(f"<tr>{cells}</tr>")
+    parts.append("</table>")
+    return "\n".join(parts)
+
+
+def assemble(sections):
+    markdown = "# Performance Report\n\n" + "\n\n".join(sections[n]["markdown"] for n in SECTION_ORDER) + "\n"
+    body = "\n".join(sections[n]["html"] for n in SECTION_ORDER)
+    page = (
+        "<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n<title>Performance Report</title>\n"
+        "</head>\n<body>\n<h1>Performance Report</h1>\n" + body + "\n</body>\n</html>\n"
+    )
+    return markdown, page
+
+
+def file_stat(path):
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def generate(history_path, config, reports_dir, force=False):
+    """
+    Regenerate reports if inputs changed.
+
+    Returns (status, rendered_sections) where status is 'unchanged' or 'updated'
+    and rendered_sections lists the sections that were re-rendered.
+    """
+    reports_dir.mkdir(parents=True, exist_ok=True)
+    state_path = reports_dir / STATE_FILE
+    md_path = reports_dir / f"{REPORT_NAME}.md"
+    html_path = reports_dir / f"{REPORT_NAME}.html"
+
+    state = {} if force else load_json(state_path, {})
+    outputs_exist = md_path.exists() and html_path.exists()
+    config_digest = digest({k: config.get(k) for k in CONFIG_SECTIONS})
+    history_stat = file_stat(history_path) if history_path.exists() else None
+
+    # Fast path: unchanged stat means unchanged file, no read needed
+    if (outputs_exist and history_stat and state.get("history_stat") == history_stat
+            and state.get("config_digest") == config_digest):
+        return "unchanged", []
+
+    raw = history_path.read_bytes() if history_path.exists() else b"[]"
+    input_digest = hashlib.sha256(raw).hexdigest()
+
+    if outputs_exist and state.get("input_digest") == input_digest and state.get("config_digest") == config_digest:
+        # Touched but not modified - remember the new stat so next run takes the fast path
+        state["history_stat"] = history_stat
+        save_json(state_path, state)
+        return "unchanged", []
+
+    history = json.loads(raw)
+    inputs = section_inputs(history, config)
+    cached = state.get("sections", {})
+    sections = {}
+    rendered = []
+
+    for name in SECTION_ORDER:
+        section_digest = digest(inputs[name])
+        previous = cached.get(name)
+        if previous and previous.get("digest") == section_digest:
+            sections[name] = previous
+            continue
+        sections[name] = {
+            "digest": section_digest,
+            "markdown": render_markdown(name, inputs[name]),
+            "html": render_html(name, inputs[name])
+        }
+        rendered.append(name)
+
+    if rendered or not outputs_exist:
+        markdown, page = assemble(sections)
+        md_path.write_text(markdown)
+        html_path.write_text(page)
+
+    save_json(state_path, {
+        "history_stat": history_stat,
+        "input_digest": input_digest,
+        "config_digest": config_digest,
+        "sections": sections
+    })
+    return "updated", rendered
+
+
+def main():
+    config = load_config()
+    base_path = Path(__file__).parent.parent.parent
+    history_path = base_path / config["paths"]["history"]
+    reports_dir = base_path / config["paths"].get("reports", "reports")
+
+    force = "--force" in sys.argv[1:]
+    status, rendered = generate(history_path, config, reports_dir, force)
+
+    if status == "unchanged":
+        print("Reports up to date (no changes to history or config)")
+        return
+
+    if rendered:
+        print(f"Updated sections: {', '.join(rendered)}")
+    else:
+        print("History changed but no report sections were affected")
+    print(f"  {reports_dir / (REPORT_NAME + '.md')}")
+    print(f"  {reports_dir / (REPORT_NAME + '.html')}")
+
+
+if __name__ == "__main__":
+    main()
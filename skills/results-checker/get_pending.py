@@ -39,18 +39,13 @@ def parse_game_time(game_time_str):
         return None
 
 
-def main():
-    config = load_config()
-    base_path = Path(__file__).parent.parent.parent
-    history_path = base_path / config["paths"]["history"]
-
-    history = load_json(history_path, [])
-
-    if not history:
-        print("No pending games to update")
-        return
-
-    now = datetime.now(timezone.utc)
+def find_pending(history, now=None):
+    """
+    Return PENDING entries whose game finished (3+ hours ago) as of now.
+    now defaults to the current UTC time.
+    """
+    if now is None:
+        now = datetime.now(timezone.utc)
     three_hours = timedelta(hours=3)
     pending_games = []
 
@@ -77,6 +72,30 @@ def main():
             "date": game_date
         })
 
+    return pending_games
+
+
+def main():
+    config = load_config()
+    base_path = Path(__file__).parent.parent.parent
+    history_path = base_path / config["paths"]["history"]
+
+    history = load_json(history_path, [])
+
+    if not history:
+        print("No pending games to update")
+        return
+
+    # Optional --now <ISO timestamp> replaces the wall clock (for replays)
+    now = None
+    if len(sys.argv) == 3 and sys.argv[1] == "--now":
+        now = parse_game_time(sys.argv[2])
+        if not now:
+            print(f"Error: invalid --now timestamp: {sys.argv[2]}")
+            sys.exit(1)
+
+    pending_games = find_pending(history, now)
+
     if not pending_games:
         print("No pending games to update")
         return
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Per-team ATS and over/under trend index built from graded games.
+update_result.py records each game as it is graded. Each team stores one
+short outcome code per game plus running totals per split, so recording a
+game and a full-season query are O(1); "last N" reads only the team's most
+recent games.
+Usage: python trend_index.py <team> [--last N] [--split all|home|away|fav|dog]
+       python trend_index.py --slate [--last N]
+       python trend_index.py --rebuild
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+
+SPLITS = ["all", "home", "away", "fav", "dog"]
+# Order of counters in each totals row
+COUNTERS = ["ats_w", "ats_l", "ats_p", "over", "under", "ou_p", "games"]
+# Outcome codes: venue (H/A), role (F/D/-), ATS (W/L/P/-), O/U (O/U/P/-)
+ATS_CODES = {"W": 0, "L": 1, "P": 2}
+OU_CODES = {"O": 3, "U": 4, "P": 5}
+NUMBER = r'\d+(?:\.\d+)?'
+
+
+def load_config():
+    """Load config.json from project root."""
+    config_path = Path(__file__).parent.parent.parent / "config.json"
+    if not config_path.exists():
+        print(f"Error: config.json not found at {config_path}")
+        sys.exit(1)
+    with open(config_path) as f:
+        return json.load(f)
+
+
+def load_json(path, default=None):
+    """Load JSON file or return default if not exists."""
+    if not path.exists():
+        return default
+    with open(path) as f:
+        return json.load(f)
+
+
+def index_path(config):
+    base_path = Path(__file__).parent.parent.parent
+    return base_path / config["paths"].get("trends", "data/trends.json")
+
+
+def empty_index():
+    return {"games": {}, "teams": {}}
+
+
+def save_index(path, index):
+    """Save the index as compact JSON."""
+    with open(path, "w") as f:
+        json.dump(index, f, separators=(",", ":"))
+
+
+def team_key(name):
+    """Normalized team name used as the index key."""
+    name = (name or "").lower()
+    name = re.sub(r"[.'’]", "", name)
+    return re.sub(r"[^a-z0-9]+", " ", name).strip()
+
+
+def parse_spread(spread_str):
+    """
+    Parse a games.json spread string.
+    Format: "Knicks -2.5" (also "Memphis +8")
+
+    Returns (team, line) or None if the format is unrecognized.
+    """
+    match = re.match(rf'^(.+?)\s+([+-]?{NUMBER})$', (spread_str or "").strip())
+    if not match:
+        return None
+    return match.group(1).strip(), float(match.group(2))
+
+
+def parse_total(total_str):
+    """
+    Parse a games.json total string.
+    Format: "O/U 228.5"
+
+    Returns the number or None.
+    """
+    match = re.search(rf'(?:^|\s)({NUMBER})$', (total_str or "").strip())
+    if not match:
+        return None
+    return float(match.group(1))
+
+
+def home_line(game_info):
+    """Spread from the home team's perspective (negative = home favored), or None."""
+    parsed = parse_spread(game_info.get("spread"))
+    if not parsed:
+        return None
+    team, line = parsed
+    if team.lower() in game_info.get("home_team", "").lower():
+        return line
+    if team.lower() in game_info.get("away_team", "").lower():
+        return -line
+    return None
+
+
+def outcome(margin, codes):
+    """Pick the win/loss/push code from a 3-character string like "WLP"."""
+    if margin > 0:
+        return codes[0]
+    if margin < 0:
+        return codes[1]
+    return codes[2]
+
+
+def code_splits(code):
+    """Splits an outcome code counts toward."""
+    venue, role = code[0], code[1]
+    splits = ["all", "home" if venue == "H" else "away"]
+    if role != "-":
+        splits.append("fav" if role == "F" else "dog")
+    return splits
+
+
+def code_counts(code):
+    """Counter row for a single outcome code."""
+    counts = [0] * len(COUNTERS)
+    if code[2] in ATS_CODES:
+        counts[ATS_CODES[code[2]]] = 1
+    if code[3] in OU_CODES:
+        counts[OU_CODES[code[3]]] = 1
+    counts[-1] = 1
+    return counts
+
+
+def record_game(index, game_info, home_score, away_score):
+    """
+    Add a graded game to the index.
+
+    game_info is the games.json entry (home_team, away_team, spread, total).
+    Returns False if the game was already recorded.
+    """
+    game_id = game_info.get("game_id")
+    if game_id in index["games"]:
+        return False
+
+    line = home_line(game_info)
+    total = parse_total(game_info.get("total"))
+    ou = "-" if total is None else outcome(home_score + away_score - total, "OUP")
+
+    sides = [
+        ("H", game_info.get("home_team"), home_score - away_score, line),
+        ("A", game_info.get("away_team"), away_score - home_score, None if line is None else -line)
+    ]
+    for venue, name, margin, team_line in sides:
+        team = index["teams"].setdefault(team_key(name), {
+            "name": name,
+            "results": [],
+            "totals": {split: [0] * len(COUNTERS) for split in SPLITS}
+        })
+        if team_line is None:
+            role, ats = "-", "-"
+        else:
+            role = "F" if team_line < 0 else "D" if team_line > 0 else "-"
+            ats = outcome(margin + team_line, "WLP")
+        code = venue + role + ats + ou
+        team["results"].append(code)
+        counts = code_counts(code)
+        for split in code_splits(code):
+            team["totals"][split] = [a + b for a, b in zip(team["totals"][split], counts)]
+
+    index["games"][game_id] = [home_score, away_score]
+    return True
+
+
+def find_team(index, name):
+    """Look up a team by exact normalized name, falling back to partial match."""
+    key = team_key(name)
+    if key in index["teams"]:
+        return index["teams"][key]
+    for team_name, team in index["teams"].items():
+        if key and key in team_name:
+            return team
+    return None
+
+
+def last_n(team, split="all", n=None):
+    """
+    Record over a team's last N games in a split (all games if N is None).
+    Uses the running totals when N covers the whole split, otherwise tallies
+    the most recent codes only.
+    Returns dict of counters including 'games'.
+    """
+    if n is not None and n < 0:
+        raise ValueError(f"N must be 0 or more: {n}")
+    totals = team["totals"][split]
+    if n is None or n >= totals[-1]:
+        return dict(zip(COUNTERS, totals))
+
+    counts = [0] * len(COUNTERS)
+    for code in reversed(team["results"]):
+        if counts[-1] == n:
+            break
+        if split in code_splits(code):
+            counts = [a + b for a, b in zip(counts, code_counts(code))]
+    return dict(zip(COUNTERS, counts))
+
+
+def format_record(record):
+    ats = f"{record['ats_w']}-{record['ats_l']}"
+    if record["ats_p"]:
+        ats += f"-{record['ats_p']}"
+    ou = f"{record['over']}-{record['under']}"
+    if record["ou_p"]:
+        ou += f"-{record['ou_p']}"
+    return f"{ats} ATS, O/U {ou} ({record['games']} games)"
+
+
+def slate_trends(index, games, n=None):
+    """
+    Trends for both teams of every game on a slate.
+    Returns list of (game_id, team_name, venue, record dict or None).
+    """
+    trends = []
+    for game in games:
+        for venue in ("away", "home"):
+            name = game.get(f"{venue}_team")
+            team = find_team(index, name)
+            record = last_n(team, venue, n) if team else None
+            trends.append((game.get("game_id"), name, venue, record))
+    return trends
+
+
+def parse_final_score(final_score, game_info):
+    """
+    Parse a history final_score against a game's teams.
+    Format: "Knicks 124, Spurs 113" (either order)
+
+    Returns (home_score, away_score) or None.
+    """
+    scores = {}
+    for part in (final_score or "").split(","):
+        match = re.match(r'^(.+?)\s+(\d+)$', part.strip())
+        if not match:
+            return None
+        name = match.group(1).lower()
+        if name in game_info.get("home_team", "").lower():
+            scores.setdefault("home", int(match.group(2)))
+        elif name in game_info.get("away_team", "").lower():
+            scores.setdefault("away", int(match.group(2)))
+    if len(scores) != 2:
+        return None
+    return scores["home"], scores["away"]
+
+
+def load_archived_games(config):
+    """
+    game_id -> games.json entry from every archived snapshot plus the current games.json.
+    Later snapshots win.
+    """
+    base_path = Path(__file__).parent.parent.parent
+    archive_dir = base_path / config["paths"].get("games_archive", "data/games_archive")
+    snapshots = sorted(archive_dir.glob("*.json")) if archive_dir.exists() else []
+    snapshots.append(base_path / config["paths"]["games"])
+
+    games_by_id = {}
+    for path in snapshots:
+        data = load_json(path, {"games": []})
+        for game in data.get("games", []):
+            games_by_id[game.get("game_id")] = game
+    return games_by_id
+
+
+def rebuild_index(history, games_by_id):
+    """
+    Build a fresh index from graded history in game_time order.
+    Returns (index, skipped) where skipped lists (game_id, reason).
+    """
+    index = empty_index()
+    skipped = []
+    graded = [h for h in history if h.get("result") in ("WIN", "LOSS", "PUSH")]
+    graded.sort(key=lambda h: h.get("game_time") or "")
+    for entry in graded:
+        game_id = entry.get("game_id")
+        game_info = games_by_id.get(game_id)
+        if not game_info:
+            skipped.append((game_id, "not in games.json or archive"))
+            continue
+        scores = parse_final_score(entry.get("final_score"), game_info)
+        if not scores:
+            skipped.append((game_id, f"could not parse final score '{entry.get('final_score')}'"))
+            continue
+        record_game(index, game_info, *scores)
+    return index, skipped
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query per-team ATS and O/U trends")
+    parser.add_argument("team", nargs="?", help="Team name (partial match, case-insensitive)")
+    parser.add_argument("--last", type=int, help="Only the last N games")
+    parser.add_argument("--split", choices=SPLITS, help="Only one split (default: all splits)")
+    parser.add_argument("--slate", action="store_true", help="Trends for every team in games.json")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="Rebuild the index from history.json and archived games snapshots")
+    args = parser.parse_args()
+
+    if args.last is not None and args.last < 0:
+        parser.error("--last must be 0 or more")
+
+    config = load_config()
+
+    if args.rebuild:
+        base_path = Path(__file__).parent.parent.parent
+        history = load_json(base_path / config["paths"]["history"], [])
+        index, skipped = rebuild_index(history, load_archived_games(config))
+        save_index(index_path(config), index)
+        print(f"Rebuilt trend index: {len(index['games'])} games, {len(index['teams'])} teams")
+        if skipped:
+            print(f"\nSkipped ({len(skipped)}):")
+            for game_id, reason in skipped:
+                print(f"  - {game_id}: {reason}")
+        return
+
+    index = load_json(index_path(config), empty_index())
+
+    if args.slate:
+        base_path = Path(__file__).parent.parent.parent
+        games_data = load_json(base_path / config["paths"]["games"], {"games": []})
+        for game_id, name, venue, record in slate_trends(index, games_data.get("games", []), args.last):
+            summary = format_record(record) if record else "no graded games"
+            print(f"{game_id} | {name} ({venue}) | {summary}")
+        return
+
+    if not args.team:
+        parser.error("team is required unless --slate is given")
+
+    team = find_team(index, args.team)
+    if not team:
+        print(f"No graded games for '{args.team}'")
+        sys.exit(1)
+
+    print(team["name"])
+    for split in [args.split] if args.split else SPLITS:
+        record = last_n(team, split, args.last)
+        if record["games"]:
+            print(f"  {split:<5} {format_record(record)}")
+
+
+if __name__ == "__main__":
+    main()
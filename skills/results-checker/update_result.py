@@ -5,10 +5,15 @@ Usage: python update_result.py <game_id> <team1_name> <team1_score> <team2_name>
 """
 
 import json
-import re
 import sys
 from pathlib import Path
 
+from trend_index import empty_index, index_path, record_game, save_index
+
+# The pick grammar lives with the logger, which parses picks as they enter history
+sys.path.insert(0, str(Path(__file__).parent.parent / "logger"))
+from log_picks import structure_pick  # noqa: E402
+
 
 def load_config():
     """Load config.json from project root."""
@@ -39,173 +44,107 @@ def teams_match(input_name, full_name):
     return input_name.lower() in full_name.lower()
 
 
-def parse_pick(pick_str):
-    """
-    Parse pick string into structured data.
+def outcome(margin):
+    """WIN if margin is positive, LOSS if negative, PUSH if zero."""
+    if margin > 0:
+        return 'WIN'
+    elif margin < 0:
+        return 'LOSS'
+    return 'PUSH'
 
-    Returns dict with:
-      - type: 'spread', 'total', or 'moneyline'
-      - For spread: team, line
-      - For total: direction ('over'/'under'), number
-      - For moneyline: team
-    """
-    pick_str = pick_str.strip()
-
-    # Match Over/Under totals: "Over 228.5" or "Under 150"
-    total_match = re.match(r'^(Over|Under)\s+([\d.]+)$', pick_str, re.IGNORECASE)
-    if total_match:
-        return {
-            'type': 'total',
-            'direction': total_match.group(1).lower(),
-            'number': float(total_match.group(2))
-        }
-
-    # Match Moneyline: "Knicks ML" or "Team Name ML"
-    ml_match = re.match(r'^(.+?)\s+ML$', pick_str, re.IGNORECASE)
-    if ml_match:
-        return {
-            'type': 'moneyline',
-            'team': ml_match.group(1).strip()
-        }
-
-    # Match Spread: "Knicks -2.5" or "Spurs +2.5" or "Team Name -5"
-    spread_match = re.match(r'^(.+?)\s+([+-][\d.]+)$', pick_str)
-    if spread_match:
-        return {
-            'type': 'spread',
-            'team': spread_match.group(1).strip(),
-            'line': float(spread_match.group(2))
-        }
-
-    return None
-
-
-def get_team_from_game(game_str, team_name):
-    """
-    Determine if team is home or away from game string.
-    Game format: "Away vs Home" (e.g., "Spurs vs Knicks")
 
-    Returns 'home' or 'away' or None if not found.
-    """
-    parts = game_str.split(' vs ')
-    if len(parts) != 2:
-        return None
+def evaluate_spread(side, line, home_score, away_score):
+    """Evaluate a spread pick on the given side. Returns WIN, LOSS, or PUSH."""
+    margin = home_score - away_score if side == 'home' else away_score - home_score
+    return outcome(margin + line)
 
-    away_team = parts[0].strip()
-    home_team = parts[1].strip()
 
-    # Check for exact match or partial match
-    if team_name.lower() == home_team.lower() or team_name.lower() in home_team.lower():
-        return 'home'
-    if team_name.lower() == away_team.lower() or team_name.lower() in away_team.lower():
-        return 'away'
+def evaluate_total(side, line, home_score, away_score):
+    """Evaluate an over/under pick against total number line. Returns WIN, LOSS, or PUSH."""
+    margin = home_score + away_score - line
+    return outcome(margin if side == 'over' else -margin)
 
-    return None
 
+def evaluate_moneyline(side, line, home_score, away_score):
+    """Evaluate a moneyline pick on the given side. Returns WIN, LOSS, or PUSH."""
+    return evaluate_spread(side, 0, home_score, away_score)
 
-def evaluate_spread(pick_data, game_str, home_score, away_score):
-    """Evaluate a spread pick. Returns WIN, LOSS, or PUSH."""
-    team = pick_data['team']
-    line = pick_data['line']
 
-    position = get_team_from_game(game_str, team)
-    if not position:
-        return None, f"Could not determine if '{team}' is home or away in '{game_str}'"
+EVALUATORS = {
+    'spread': evaluate_spread,
+    'total': evaluate_total,
+    'moneyline': evaluate_moneyline
+}
 
-    if position == 'home':
-        picked_score = home_score
-        opponent_score = away_score
-    else:
-        picked_score = away_score
-        opponent_score = home_score
 
-    # Calculate: picked_team_score - opponent_score + line
-    margin = picked_score - opponent_score + line
+VALID_SIDES = {
+    'spread': ('home', 'away'),
+    'total': ('over', 'under'),
+    'moneyline': ('home', 'away')
+}
 
-    if margin > 0:
-        return 'WIN', None
-    elif margin < 0:
-        return 'LOSS', None
-    else:
-        return 'PUSH', None
-
-
-def evaluate_total(pick_data, home_score, away_score):
-    """Evaluate a total (over/under) pick. Returns WIN, LOSS, or PUSH."""
-    direction = pick_data['direction']
-    number = pick_data['number']
-
-    total = home_score + away_score
-
-    if direction == 'over':
-        if total > number:
-            return 'WIN', None
-        elif total < number:
-            return 'LOSS', None
-        else:
-            return 'PUSH', None
-    else:  # under
-        if total < number:
-            return 'WIN', None
-        elif total > number:
-            return 'LOSS', None
-        else:
-            return 'PUSH', None
-
-
-def evaluate_moneyline(pick_data, game_str, home_score, away_score):
-    """Evaluate a moneyline pick. Returns WIN, LOSS, or PUSH."""
-    team = pick_data['team']
-
-    position = get_team_from_game(game_str, team)
-    if not position:
-        return None, f"Could not determine if '{team}' is home or away in '{game_str}'"
-
-    if position == 'home':
-        picked_score = home_score
-        opponent_score = away_score
-    else:
-        picked_score = away_score
-        opponent_score = home_score
 
-    if picked_score > opponent_score:
-        return 'WIN', None
-    elif picked_score < opponent_score:
-        return 'LOSS', None
+def pick_fields(entry):
+    """
+    Return (bet_type, side, line) for a history entry, or (None, error).
+
+    Entries logged by log_picks.py carry these fields already. Older entries
+    are parsed from the pick and game strings with the logger's parser.
+    """
+    if "bet_type" in entry:
+        fields = {k: entry.get(k) for k in ("bet_type", "side", "line")}
     else:
-        return 'PUSH', None
+        fields, error = structure_pick(entry, None)
+        if error:
+            return None, f"Could not parse pick: {error}"
 
+    bet_type, side, line = fields["bet_type"], fields["side"], fields["line"]
+    if bet_type not in EVALUATORS:
+        return None, f"Unknown pick type: {bet_type}"
+    if side not in VALID_SIDES[bet_type]:
+        return None, f"Invalid side '{side}' for {bet_type} pick"
+    if bet_type != 'moneyline' and (isinstance(line, bool) or not isinstance(line, (int, float))):
+        return None, f"Missing line for {bet_type} pick"
+    return (bet_type, side, line), None
 
-def main():
-    # Parse arguments
-    if len(sys.argv) != 6:
-        print("Usage: python update_result.py <game_id> <team1_name> <team1_score> <team2_name> <team2_score>")
-        print("Example: python update_result.py ncaab-2025-12-16-tenn-lou Tennessee 83 Louisville 62")
-        sys.exit(1)
 
-    game_id = sys.argv[1]
-    team1_name = sys.argv[2]
-    team2_name = sys.argv[4]
+def grade_entry(entry, home_score, away_score):
+    """
+    Grade a history entry against final scores.
+    Returns (result, error) where result is WIN, LOSS, or PUSH.
+    """
+    fields, error = pick_fields(entry)
+    if error:
+        return None, error
+    bet_type, side, line = fields
+    return EVALUATORS[bet_type](side, line, home_score, away_score), None
 
-    try:
-        team1_score = int(sys.argv[3])
-        team2_score = int(sys.argv[5])
-    except ValueError:
-        print(f"Error: Scores must be integers. Got: {sys.argv[3]}, {sys.argv[5]}")
-        sys.exit(1)
 
-    # Load config, games, and history
-    config = load_config()
-    base_path = Path(__file__).parent.parent.parent
-    games_path = base_path / config["paths"]["games"]
-    history_path = base_path / config["paths"]["history"]
+def grade_batch(entries, scores):
+    """
+    Grade many history entries in one pass.
 
+    scores is a list of (home_score, away_score) parallel to entries.
+    Returns a list of (result, error) parallel to entries; an entry that
+    can't be graded gets an error without stopping the rest.
+    """
+    if len(entries) != len(scores):
+        raise ValueError("entries and scores must have the same length")
+    return [grade_entry(entry, home, away) for entry, (home, away) in zip(entries, scores)]
+
+
+def record_result(games_path, history_path, trends_path, game_id, team1_name, team1_score, team2_name, team2_score):
+    """
+    Grade one game's pick, save it to history.json and add the game to the trend index.
+
+    Returns (status, message) where status is 'updated', 'skipped' (already graded),
+    or 'error'.
+    """
     games_data = load_json(games_path, {"games": []})
     history = load_json(history_path, [])
 
     if not history:
-        print(f"Error: history.json is empty or not found")
-        sys.exit(1)
+        return "error", "history.json is empty or not found"
 
     # Find the game in games.json to get home/away teams
     game_info = None
@@ -215,8 +154,7 @@ def main():
             break
 
     if not game_info:
-        print(f"Error: game_id '{game_id}' not found in games.json")
-        sys.exit(1)
+        return "error", f"game_id '{game_id}' not found in games.json"
 
     home_team_full = game_info.get("home_team", "")
     away_team_full = game_info.get("away_team", "")
@@ -235,30 +173,25 @@ def main():
         away_score = team1_score
         away_team_matched = team1_name
     else:
-        print(f"Error: '{team1_name}' does not match home team '{home_team_full}' or away team '{away_team_full}'")
-        sys.exit(1)
+        return "error", f"'{team1_name}' does not match home team '{home_team_full}' or away team '{away_team_full}'"
 
     # Check if team2 is home or away
     if teams_match(team2_name, home_team_full):
         if home_score is not None:
-            print(f"Error: Both '{team1_name}' and '{team2_name}' match home team '{home_team_full}'")
-            sys.exit(1)
+            return "error", f"Both '{team1_name}' and '{team2_name}' match home team '{home_team_full}'"
         home_score = team2_score
         home_team_matched = team2_name
     elif teams_match(team2_name, away_team_full):
         if away_score is not None:
-            print(f"Error: Both '{team1_name}' and '{team2_name}' match away team '{away_team_full}'")
-            sys.exit(1)
+            return "error", f"Both '{team1_name}' and '{team2_name}' match away team '{away_team_full}'"
         away_score = team2_score
         away_team_matched = team2_name
     else:
-        print(f"Error: '{team2_name}' does not match home team '{home_team_full}' or away team '{away_team_full}'")
-        sys.exit(1)
+        return "error", f"'{team2_name}' does not match home team '{home_team_full}' or away team '{away_team_full}'"
 
     # Verify we have both scores
     if home_score is None or away_score is None:
-        print(f"Error: Could not assign both home and away scores")
-        sys.exit(1)
+        return "error", "Could not assign both home and away scores"
 
     # Find the history entry
     entry_idx = None
@@ -268,40 +201,19 @@ def main():
             break
 
     if entry_idx is None:
-        print(f"Error: game_id '{game_id}' not found in history.json")
-        sys.exit(1)
+        return "error", f"game_id '{game_id}' not found in history.json"
 
     entry = history[entry_idx]
 
     # Check if already has result
     if entry.get("result") != "PENDING":
-        print(f"Warning: {game_id} already has result '{entry.get('result')}'. Skipping.")
-        sys.exit(0)
+        return "skipped", f"{game_id} already has result '{entry.get('result')}'. Skipping."
 
-    # Parse the pick
     pick_str = entry.get("pick")
-    pick_data = parse_pick(pick_str)
-
-    if not pick_data:
-        print(f"Error: Could not parse pick format: '{pick_str}'")
-        sys.exit(1)
-
-    game_str = entry.get("game")
-
-    # Evaluate based on pick type
-    if pick_data['type'] == 'spread':
-        result, error = evaluate_spread(pick_data, game_str, home_score, away_score)
-    elif pick_data['type'] == 'total':
-        result, error = evaluate_total(pick_data, home_score, away_score)
-    elif pick_data['type'] == 'moneyline':
-        result, error = evaluate_moneyline(pick_data, game_str, home_score, away_score)
-    else:
-        print(f"Error: Unknown pick type: {pick_data['type']}")
-        sys.exit(1)
+    result, error = grade_entry(entry, home_score, away_score)
 
     if error:
-        print(f"Error: {error}")
-        sys.exit(1)
+        return "error", error
 
     # Build final score string using matched team names (capitalize first letter)
     final_score = f"{home_team_matched.title()} {home_score}, {away_team_matched.title()} {away_score}"
@@ -313,9 +225,51 @@ def main():
     # Save
     save_json(history_path, history)
 
-    # Print confirmation
-    print(f"Updated {game_id}: {pick_str} -> {result} ({final_score})")
+    # Add the graded game to the per-team trend index
+    index = load_json(trends_path, empty_index())
+    if record_game(index, game_info, home_score, away_score):
+        save_index(trends_path, index)
 
+    return "updated", f"Updated {game_id}: {pick_str} -> {result} ({final_score})"
+
+
+def main():
+    # Parse arguments
+    if len(sys.argv) != 6:
+        print("Usage: python update_result.py <game_id> <team1_name> <team1_score> <team2_name> <team2_score>")
+        print("Example: python update_result.py ncaab-2025-12-16-tenn-lou Tennessee 83 Louisville 62")
+        sys.exit(1)
+
+    game_id = sys.argv[1]
+    team1_name = sys.argv[2]
+    team2_name = sys.argv[4]
+
+    try:
+        team1_score = int(sys.argv[3])
+        team2_score = int(sys.argv[5])
+    except ValueError:
+        print(f"Error: Scores must be integers. Got: {sys.argv[3]}, {sys.argv[5]}")
+        sys.exit(1)
+
+    config = load_config()
+    base_path = Path(__file__).parent.parent.parent
+    games_path = base_path / config["paths"]["games"]
+    history_path = base_path / config["paths"]["history"]
+
+    status, message = record_result(
+        games_path, history_path, index_path(config),
+        game_id, team1_name, team1_score, team2_name, team2_score
+    )
+
+    if status == "error":
+        print(f"Error: {message}")
+        sys.exit(1)
+    if status == "skipped":
+        print(f"Warning: {message}")
+        sys.exit(0)
+
+    # Print confirmation
+    print(message)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Replays a season through the full pipeline against a simulated clock.
+Each simulated day: validate games.json, make and validate picks for games
+that haven't started, log picks, find pending games, and grade them.
+Reports throughput and per-stage latency as history grows.
+Usage: python replay.py [--days N] [--games-per-day N] [--seed N] [--recorded DIR] [--keep DIR]
+"""
+
+import argparse
+import json
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+BASE_PATH = Path(__file__).parent.parent
+for skill in ["game-scraper", "pick-generator", "logger", "results-checker"]:
+    sys.path.insert(0, str(BASE_PATH / "skills" / skill))
+
+from get_pending import find_pending  # noqa: E402
+from log_picks import log_picks  # noqa: E402
+from save_games import validate_games_file  # noqa: E402
+from save_picks import game_started, validate_picks_file  # noqa: E402
+from update_result import record_result  # noqa: E402
+
+STAGES = ["scrape", "picks", "log", "pending", "grade"]
+SLATE_HOUR = 17  # UTC hour picks are made each day
+CHECK_HOUR = 12  # UTC hour results are checked the next day
+SEASON_START = datetime(2025, 11, 1, tzinfo=timezone.utc)
+
+
+class SimulatedClock:
+    """Clock the pipeline reads instead of the wall clock."""
+
+    def __init__(self, start):
+        self.current = start
+
+    def now(self):
+        return self.current
+
+    def set(self, moment):
+        self.current = moment
+
+    def advance(self, delta):
+        self.current += delta
+
+
+def load_json(path, default=None):
+    """Load JSON file or return default if not exists."""
+    if not path.exists():
+        return default
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_json(path, data):
+    """Save data to JSON file with pretty formatting."""
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+def iso(moment):
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+# --- Season sources ---
+
+def synthetic_season(days, games_per_day, seed):
+    """
+    Yield (date, games_data, scores) for a synthetic season.
+    scores maps game_id -> (home_score, away_score).
+    """
+    rng = random.Random(seed)
+    teams = {
+        "NBA": [(f"City{i:02d} Hawks{i:02d}", f"Hawks{i:02d}", f"n{i:02d}") for i in range(30)],
+        "NCAAB": [(f"State{i:03d} Owls{i:03d}", f"Owls{i:03d}", f"c{i:03d}") for i in range(150)]
+    }
+    for day in range(days):
+        date = SEASON_START + timedelta(days=day)
+        games = []
+        scores = {}
+        used = set()
+        for _ in range(games_per_day):
+            sport = rng.choice(["NBA", "NCAAB"])
+            pool = [t for t in teams[sport] if t[0] not in used]
+            if len(pool) < 2:
+                continue
+            away, home = rng.sample(pool, 2)
+            used.update([away[0], home[0]])
+
+            game_id = f"{sport.lower()}-{date:%Y-%m-%d}-{away[2]}-{home[2]}"
+            tip = date + timedelta(hours=rng.choice([23, 24, 25, 26]), minutes=rng.choice([0, 30]))
+            line = rng.choice([x / 2 for x in range(1, 30)])
+            total = rng.choice([x + 0.5 for x in range(135, 240)])
+            favorite = home if rng.random() < 0.6 else away
+            underdog = away if favorite is home else home
+            fav_ml = -int(100 + line * 20)
+            dog_ml = int(100 + line * 17)
+
+            base = total / 2
+            margin = rng.gauss(line, 11)
+            fav_score = max(40, round(base + margin / 2 + rng.gauss(0, 6)))
+            dog_score = max(40, round(base - margin / 2 + rng.gauss(0, 6)))
+            if fav_score == dog_score:
+                fav_score += 1
+
+            games.append({
+                "game_id": game_id,
+                "sport": sport,
+                "away_team": away[0],
+                "home_team": home[0],
+                "game_time": iso(tip),
+                "spread": f"{favorite[1]} -{line:g}",
+                "moneyline": f"{favorite[1]} {fav_ml} / {underdog[1]} +{dog_ml}",
+                "total": f"O/U {total:g}",
+                "venue": f"{home[1]} Arena"
+            })
+            if favorite is home:
+                scores[game_id] = (fav_score, dog_score)
+            else:
+                scores[game_id] = (dog_score, fav_score)
+
+        yield date, {"fetched_at": iso(date + timedelta(hours=SLATE_HOUR - 1)), "games": games}, scores
+
+
+def recorded_season(directory):
+    """
+    Yield (date, games_data, scores) from recorded day directories.
+    Each DIR/YYYY-MM-DD/ holds games.json and scores.json ({game_id: [home, away]}).
+    """
+    for day_dir in sorted(p for p in Path(directory).iterdir() if p.is_dir()):
+        date = datetime.strptime(day_dir.name, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        games_data = load_json(day_dir / "games.json", {"games": []})
+        scores = {k: tuple(v) for k, v in load_json(day_dir / "scores.json", {}).items()}
+        yield date, games_data, scores
+
+
+def make_picks(games_data, now, rng):
+    """Synthetic pick-generator: one bet on roughly half the games that haven't started."""
+    picks = []
+    for game in games_data.get("games", []):
+        if game_started(game["game_time"], now):
+            continue
+        base = {
+            "game_id": game["game_id"],
+            "sport": game["sport"],
+            "game": f"{game['away_team'].split()[-1]} vs {game['home_team'].split()[-1]}",
+            "created_at": iso(now)
+        }
+        if rng.random() < 0.5:
+            picks.append(dict(base, pick="NO PICK", reasoning="No edge.", confidence=None))
+            continue
+
+        choice = rng.choice(["spread", "total", "moneyline"])
+        if choice == "spread":
+            team, line = game["spread"].rsplit(" ", 1)
+            pick = f"{team} {line}"
+        elif choice == "total":
+            pick = f"{rng.choice(['Over', 'Under'])} {game['total'].split()[-1]}"
+        else:
+            pick = f"{game['moneyline'].split(' / ')[0].rsplit(' ', 1)[0]} ML"
+        picks.append(dict(
+            base, pick=pick, odds=-110, reasoning="Replay pick.",
+            confidence=rng.choice(["low", "medium", "medium", "high"]), updated_at=iso(now)
+        ))
+    return {"created_at": iso(now), "picks": picks}
+
+
+# --- Pipeline ---
+
+def run_day(paths, clock, date, games_data, scores, rng, timings, totals):
+    """Run one simulated day through every stage, appending stage latencies to timings."""
+
+    # Stage 1: scrape snapshot lands, validate it
+    clock.set(date + timedelta(hours=SLATE_HOUR))
+    started = time.perf_counter()
+    save_json(paths["games"], games_data)
+    is_valid, errors, _ = validate_games_file(paths["games"])
+    timings["scrape"].append(time.perf_counter() - started)
+    if not is_valid:
+        raise RuntimeError(f"games.json invalid on {date:%Y-%m-%d}: {errors[:3]}")
+    totals["games"] += len(games_data.get("games", []))
+
+    # Stage 2: picks for games not yet started, validate them
+    started = time.perf_counter()
+    picks_data = make_picks(games_data, clock.now(), rng)
+    save_json(paths["picks"], picks_data)
+    is_valid, errors, stats = validate_picks_file(paths["picks"], paths["games"], clock.now())
+    timings["picks"].append(time.perf_counter() - started)
+    if not is_valid:
+        raise RuntimeError(f"picks.json invalid on {date:%Y-%m-%d}: {errors[:3]}")
+    totals["picks"] += stats.get("actual_picks", 0)
+
+    # Stage 3: log picks into history
+    started = time.perf_counter()
+    history = load_json(paths["history"], [])
+    counts = log_picks(load_json(paths["picks"]), load_json(paths["games"]), history)
+    save_json(paths["history"], history)
+    timings["log"].append(time.perf_counter() - started)
+    if counts["rejected"]:
+        raise RuntimeError(f"picks rejected by logger on {date:%Y-%m-%d}: {counts['errors'][:3]}")
+
+    # Stage 4: next morning, find finished games
+    clock.set(date + timedelta(days=1, hours=CHECK_HOUR))
+    started = time.perf_counter()
+    pending = find_pending(load_json(paths["history"], []), clock.now())
+    timings["pending"].append(time.perf_counter() - started)
+
+    # Stage 5: grade each one through update_result.py's production path
+    started = time.perf_counter()
+    teams = {g["game_id"]: (g["home_team"], g["away_team"]) for g in load_json(paths["games"], {"games": []})["games"]}
+    for game in pending:
+        game_id = game["game_id"]
+        if game_id not in scores or game_id not in teams:
+            # Stays PENDING and comes back every day; reported in the summary
+            totals["ungraded"].add(game_id)
+            continue
+        home_score, away_score = scores[game_id]
+        # Pass nicknames in away-first order, as results are usually looked up
+        home_name, away_name = (name.split()[-1] for name in teams[game_id])
+        status, message = record_result(
+            paths["games"], paths["history"], paths["trends"],
+            game_id, away_name, away_score, home_name, home_score
+        )
+        if status != "updated":
+            raise RuntimeError(f"{game_id}: {message}")
+        totals["graded"] += 1
+    timings["grade"].append(time.perf_counter() - started)
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a season through the pick pipeline")
+    parser.add_argument("--days", type=int, default=150, help="Synthetic season length (default: 150)")
+    parser.add_argument("--games-per-day", type=int, default=20, help="Synthetic games per day (default: 20)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed (default: 1)")
+    parser.add_argument("--recorded", help="Directory of recorded days instead of a synthetic season")
+    parser.add_argument("--keep", help="Copy the final data files to this directory")
+    args = parser.parse_args()
+
+    season = recorded_season(args.recorded) if args.recorded else \
+        synthetic_season(args.days, args.games_per_day, args.seed)
+    rng = random.Random(args.seed)
+
+    work_dir = Path(tempfile.mkdtemp(prefix="replay-"))
+    paths = {name: work_dir / f"{name}.json" for name in ["games", "picks", "history", "trends"]}
+    clock = SimulatedClock(SEASON_START)
+    timings = {stage: [] for stage in STAGES}
+    totals = {"days": 0, "games": 0, "picks": 0, "graded": 0, "ungraded": set()}
+
+    wall_start = time.perf_counter()
+    try:
+        for date, games_data, scores in season:
+            run_day(paths, clock, date, games_data, scores, rng, timings, totals)
+            totals["days"] += 1
+        elapsed = time.perf_counter() - wall_start
+        history_size = len(load_json(paths["history"], []))
+        if args.keep:
+            Path(args.keep).mkdir(parents=True, exist_ok=True)
+            for path in paths.values():
+                if path.exists():
+                    shutil.copy(path, Path(args.keep) / path.name)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if not totals["days"]:
+        print("No days to replay")
+        return
+
+    print(f"Replayed {totals['days']} days in {elapsed:.2f}s (simulated clock ended {iso(clock.now())})")
+    print(f"  Games: {totals['games']}  Picks: {totals['picks']}  Graded: {totals['graded']}  History: {history_size}")
+    print(f"  Throughput: {totals['days'] / elapsed:.1f} days/s, {totals['games'] / elapsed:.1f} games/s, "
+          f"{totals['graded'] / elapsed:.1f} grades/s")
+    if totals["ungraded"]:
+        ungraded = sorted(totals["ungraded"])
+        print(f"  Ungraded (no recorded score or not in games.json, left PENDING): {len(ungraded)}")
+        for game_id in ungraded[:10]:
+            print(f"    - {game_id}")
+        if len(ungraded) > 10:
+            print(f"    ... and {len(ungraded) - 10} more")
+
+    print(f"\n{'Stage':<8} {'total s':>8} {'mean ms':>8} {'p95 ms':>8} {'max ms':>8} {'last ms':>8}")
+    for stage in STAGES:
+        values = timings[stage]
+        print(f"{stage:<8} {sum(values):8.2f} {statistics.mean(values) * 1000:8.2f} "
+              f"{percentile(values, 0.95) * 1000:8.2f} {max(values) * 1000:8.2f} {values[-1] * 1000:8.2f}")
+
+
+if __name__ == "__main__":
+    main()